@@ -1,4 +1,4 @@
-from sqlalchemy import create_engine, Column, Integer, String, Float, DateTime, ForeignKey, Text
+from sqlalchemy import create_engine, event, Column, Integer, String, Float, DateTime, ForeignKey, Text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, relationship
 from datetime import datetime
@@ -10,6 +10,14 @@ DATABASE_URL = "sqlite:///./food_rescue.db"
 # Create engine
 engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
 
+@event.listens_for(engine, "connect")
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Use WAL so readers don't block on writers, and skip the per-commit fsync"""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.close()
+
 # Create session
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
@@ -26,7 +34,7 @@ class Donation(Base):
     photo_url = Column(String(255))
     latitude = Column(Float)
     longitude = Column(Float)
-    status = Column(String(20), default="available")  # available, accepted, picked_up, delivered
+    status = Column(String(20), default="available", index=True)  # available, accepted, picked_up, delivered
     created_at = Column(DateTime, default=datetime.utcnow)
     expires_at = Column(DateTime)
     
@@ -52,8 +60,8 @@ class Pickup(Base):
     __tablename__ = "pickups"
     
     id = Column(Integer, primary_key=True, index=True)
-    donation_id = Column(Integer, ForeignKey("donations.id"))
-    ngo_id = Column(Integer, ForeignKey("ngos.id"))
+    donation_id = Column(Integer, ForeignKey("donations.id"), index=True)
+    ngo_id = Column(Integer, ForeignKey("ngos.id"), index=True)
     pickup_time = Column(DateTime)
     delivery_time = Column(DateTime)
     beneficiaries_count = Column(Integer, default=0)
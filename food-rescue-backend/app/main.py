@@ -1,7 +1,10 @@
 from fastapi import FastAPI, Depends, HTTPException, UploadFile, File, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from sqlalchemy.orm import Session
+from fastapi.responses import Response
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import case, func, select
+from sqlalchemy.orm import Session, joinedload
 from typing import List
 import shutil
 import os
@@ -33,10 +36,12 @@ app.mount("/uploads", StaticFiles(directory="uploads"), name="uploads")
 def startup_event():
     create_tables()
 
-# Health check
+# Health check (constant payload, serialized once at import)
+HEALTH_RESPONSE_BODY = json.dumps({"message": "Food Rescue Matchmaker API is running!"}).encode()
+
 @app.get("/")
 def read_root():
-    return {"message": "Food Rescue Matchmaker API is running!"}
+    return Response(content=HEALTH_RESPONSE_BODY, media_type="application/json")
 
 # DONATION ENDPOINTS
 
@@ -110,9 +115,9 @@ async def upload_photo(donation_id: int, file: UploadFile = File(...), db: Sessi
     unique_filename = f"{uuid.uuid4()}.{file_extension}"
     file_path = f"uploads/{unique_filename}"
     
-    # Save file
+    # Save file (copy in the threadpool so large uploads don't block the event loop)
     with open(file_path, "wb") as buffer:
-        shutil.copyfileobj(file.file, buffer)
+        await run_in_threadpool(shutil.copyfileobj, file.file, buffer)
     
     # Update donation with photo URL
     donation.photo_url = f"/uploads/{unique_filename}"
@@ -125,8 +130,6 @@ async def upload_photo(donation_id: int, file: UploadFile = File(...), db: Sessi
 @app.post("/ngos/", response_model=NGOResponse)
 def create_ngo(ngo: NGOCreate, db: Session = Depends(get_db)):
     """Register a new NGO"""
-    import json
-    
     # Convert food types list to JSON string if it's a list
     ngo_data = ngo.dict()
     if isinstance(ngo_data.get('accepted_food_types'), list):
@@ -177,13 +180,18 @@ async def create_pickup(pickup: PickupCreate, db: Session = Depends(get_db)):
 @app.patch("/pickups/{pickup_id}")
 async def update_pickup_status(pickup_id: int, update: PickupUpdate, db: Session = Depends(get_db)):
     """Update pickup status (picked_up, delivered)"""
-    pickup = db.query(Pickup).filter(Pickup.id == pickup_id).first()
+    # Load the pickup with its donation and NGO in one statement
+    pickup = (
+        db.query(Pickup)
+        .options(joinedload(Pickup.donation), joinedload(Pickup.ngo))
+        .filter(Pickup.id == pickup_id)
+        .first()
+    )
     if not pickup:
         raise HTTPException(status_code=404, detail="Pickup not found")
     
     # Get NGO name for notification
-    ngo = db.query(NGO).filter(NGO.id == pickup.ngo_id).first()
-    ngo_name = ngo.name if ngo else "Unknown NGO"
+    ngo_name = pickup.ngo.name if pickup.ngo else "Unknown NGO"
     
     # Update pickup
     if update.beneficiaries_count is not None:
@@ -229,13 +237,21 @@ def get_pickups(ngo_id: int = None, db: Session = Depends(get_db)):
 @app.get("/stats/")
 def get_statistics(db: Session = Depends(get_db)):
     """Get platform statistics for impact dashboard"""
-    total_donations = db.query(Donation).count()
-    delivered_donations = db.query(Donation).filter(Donation.status == "delivered").count()
-    total_beneficiaries = db.query(Pickup).filter(Pickup.delivery_time.isnot(None)).with_entities(
-        db.func.sum(Pickup.beneficiaries_count)
-    ).scalar() or 0
-    
-    active_ngos = db.query(NGO).count()
+    # Single query: one pass over donations plus scalar subqueries for pickups and NGOs
+    total_beneficiaries = (
+        select(func.coalesce(func.sum(Pickup.beneficiaries_count), 0))
+        .where(Pickup.delivery_time.isnot(None))
+        .scalar_subquery()
+    )
+    active_ngos = select(func.count(NGO.id)).scalar_subquery()
+    total_donations, delivered_donations, total_beneficiaries, active_ngos = db.execute(
+        select(
+            func.count(Donation.id),
+            func.coalesce(func.sum(case((Donation.status == "delivered", 1), else_=0)), 0),
+            total_beneficiaries,
+            active_ngos,
+        )
+    ).one()
     
     return {
         "total_donations": total_donations,
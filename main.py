@@ -1,7 +1,8 @@
 from fastapi import FastAPI, HTTPException, UploadFile, File, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, Response
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
 from typing import List, Optional, Dict, Any
 from datetime import datetime
@@ -11,6 +12,7 @@ import os
 import uuid
 import webbrowser
 import threading
+import socket
 import time
 import json
 import asyncio
@@ -117,10 +119,23 @@ def serve_frontend():
     return FileResponse("food-rescue-frontend/index.html")
 
 # Database setup
+DB_PATH = 'food_rescue.db'
+
+def get_db_connection():
+    """Open a connection to the app database with per-connection pragmas applied"""
+    conn = sqlite3.connect(DB_PATH)
+    # Safe with WAL and avoids an fsync on every commit
+    conn.execute('PRAGMA synchronous=NORMAL')
+    return conn
+
 def init_db():
-    conn = sqlite3.connect('food_rescue.db')
+    conn = get_db_connection()
     cursor = conn.cursor()
     
+    # WAL is persistent in the database file, so every tool opening it lets
+    # readers proceed while a writer commits
+    cursor.execute('PRAGMA journal_mode=WAL')
+    
     # Create tables with new schema
     cursor.execute('''
         CREATE TABLE IF NOT EXISTS donations (
@@ -204,6 +219,12 @@ def init_db():
         )
     ''')
     
+    # Indexes for the status/donor filters and the pickup joins
+    cursor.execute('CREATE INDEX IF NOT EXISTS ix_donations_status ON donations (status)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS ix_donations_donor_status ON donations (donor_user, status)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS ix_pickups_donation_id ON pickups (donation_id)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS ix_pickups_ngo_id ON pickups (ngo_id)')
+    
     conn.commit()
     conn.close()
 
@@ -211,9 +232,16 @@ def init_db():
 @app.on_event("startup")
 def startup_event():
     init_db()
-    # Auto-open browser after a short delay
+    # Auto-open browser once the server is accepting connections
     def open_browser():
-        time.sleep(1.5)  # Wait for server to start
+        # Poll the port instead of sleeping a fixed time (give up after 5s)
+        deadline = time.monotonic() + 5.0
+        while time.monotonic() < deadline:
+            try:
+                with socket.create_connection(("127.0.0.1", 8000), timeout=0.1):
+                    break
+            except OSError:
+                time.sleep(0.05)
         webbrowser.open("http://127.0.0.1:8000")
     
     # Run in a separate thread so it doesn't block startup
@@ -248,15 +276,17 @@ class PickupCreate(BaseModel):
 
 # API Endpoints
 
-# Health check - API endpoint
+# Health check - API endpoint (constant payload, serialized once at import)
+HEALTH_RESPONSE_BODY = json.dumps({"message": "Food Rescue Matchmaker API is running!", "status": "success"}).encode()
+
 @app.get("/api/health")
 def health_check():
-    return {"message": "Food Rescue Matchmaker API is running!", "status": "success"}
+    return Response(content=HEALTH_RESPONSE_BODY, media_type="application/json")
 
 @app.post("/api/donations/")
 async def create_donation(donation: DonationCreate):
     try:
-        conn = sqlite3.connect('food_rescue.db')
+        conn = get_db_connection()
         cursor = conn.cursor()
         
         # Handle None values for new fields
@@ -297,7 +327,7 @@ async def create_donation(donation: DonationCreate):
 
 @app.get("/api/donations/")
 def get_donations(status: Optional[str] = None, donor_user: Optional[str] = None):
-    conn = sqlite3.connect('food_rescue.db')
+    conn = get_db_connection()
     cursor = conn.cursor()
     
     query = 'SELECT * FROM donations'
@@ -327,7 +357,7 @@ def get_donations(status: Optional[str] = None, donor_user: Optional[str] = None
 
 @app.patch("/donations/{donation_id}/status")
 def update_donation_status(donation_id: int, status: str):
-    conn = sqlite3.connect('food_rescue.db')
+    conn = get_db_connection()
     cursor = conn.cursor()
     
     cursor.execute('UPDATE donations SET status = ? WHERE id = ?', (status, donation_id))
@@ -348,12 +378,12 @@ async def upload_photo(donation_id: int, file: UploadFile = File(...)):
     unique_filename = f"{uuid.uuid4()}.{file_extension}"
     file_path = f"uploads/{unique_filename}"
     
-    # Save file
+    # Save file (copy in the threadpool so large uploads don't block the event loop)
     with open(file_path, "wb") as buffer:
-        shutil.copyfileobj(file.file, buffer)
+        await run_in_threadpool(shutil.copyfileobj, file.file, buffer)
     
     # Update donation with photo URL
-    conn = sqlite3.connect('food_rescue.db')
+    conn = get_db_connection()
     cursor = conn.cursor()
     
     photo_url = f"/uploads/{unique_filename}"
@@ -370,7 +400,7 @@ async def upload_photo(donation_id: int, file: UploadFile = File(...)):
 
 @app.post("/api/ngos/")
 def create_ngo(ngo: NGOCreate):
-    conn = sqlite3.connect('food_rescue.db')
+    conn = get_db_connection()
     cursor = conn.cursor()
     
     cursor.execute('''
@@ -387,7 +417,7 @@ def create_ngo(ngo: NGOCreate):
 
 @app.get("/api/ngos/")
 def get_ngos():
-    conn = sqlite3.connect('food_rescue.db')
+    conn = get_db_connection()
     cursor = conn.cursor()
     
     cursor.execute('SELECT * FROM ngos')
@@ -399,7 +429,7 @@ def get_ngos():
 
 @app.post("/api/pickups/")
 async def create_pickup(pickup: PickupCreate):
-    conn = sqlite3.connect('food_rescue.db')
+    conn = get_db_connection()
     cursor = conn.cursor()
     
     # Check if donation exists and is available
@@ -434,12 +464,15 @@ async def create_pickup(pickup: PickupCreate):
 
 @app.patch("/pickups/{pickup_id}")
 async def update_pickup(pickup_id: int, status: str, beneficiaries_count: Optional[int] = None):
-    conn = sqlite3.connect('food_rescue.db')
+    conn = get_db_connection()
     cursor = conn.cursor()
     
-    # Get pickup and donation info
+    # Get pickup and current donation status (for broadcasting) in one query
     cursor.execute('''
-        SELECT p.donation_id FROM pickups p WHERE p.id = ?
+        SELECT p.donation_id, d.status
+        FROM pickups p
+        JOIN donations d ON p.donation_id = d.id
+        WHERE p.id = ?
     ''', (pickup_id,))
     
     result = cursor.fetchone()
@@ -447,11 +480,7 @@ async def update_pickup(pickup_id: int, status: str, beneficiaries_count: Option
         conn.close()
         raise HTTPException(status_code=404, detail="Pickup not found")
     
-    donation_id = result[0]
-    
-    # Get current status for broadcasting
-    cursor.execute('SELECT status FROM donations WHERE id = ?', (donation_id,))
-    old_status = cursor.fetchone()[0]
+    donation_id, old_status = result
     
     # Update pickup
     if beneficiaries_count is not None:
@@ -480,7 +509,7 @@ async def update_pickup(pickup_id: int, status: str, beneficiaries_count: Option
 
 @app.get("/api/donations/{donation_id}")
 def get_donation(donation_id: int):
-    conn = sqlite3.connect('food_rescue.db')
+    conn = get_db_connection()
     cursor = conn.cursor()
     
     cursor.execute('''
@@ -526,7 +555,7 @@ def get_donation(donation_id: int):
 
 @app.get("/api/pickups/")
 def get_pickups():
-    conn = sqlite3.connect('food_rescue.db')
+    conn = get_db_connection()
     cursor = conn.cursor()
     
     cursor.execute('''
@@ -559,21 +588,18 @@ def get_pickups():
 
 @app.get("/api/stats/")
 def get_statistics():
-    conn = sqlite3.connect('food_rescue.db')
+    conn = get_db_connection()
     cursor = conn.cursor()
     
-    # Get stats
-    cursor.execute('SELECT COUNT(*) FROM donations')
-    total_donations = cursor.fetchone()[0]
-    
-    cursor.execute("SELECT COUNT(*) FROM donations WHERE status = 'delivered'")
-    delivered_donations = cursor.fetchone()[0]
-    
-    cursor.execute('SELECT COALESCE(SUM(beneficiaries_count), 0) FROM pickups WHERE delivery_time IS NOT NULL')
-    total_beneficiaries = cursor.fetchone()[0]
-    
-    cursor.execute('SELECT COUNT(*) FROM ngos')
-    active_ngos = cursor.fetchone()[0]
+    # Get all stats in one round-trip (one pass over donations plus two subqueries)
+    cursor.execute('''
+        SELECT COUNT(*),
+               COALESCE(SUM(status = 'delivered'), 0),
+               (SELECT COALESCE(SUM(beneficiaries_count), 0) FROM pickups WHERE delivery_time IS NOT NULL),
+               (SELECT COUNT(*) FROM ngos)
+        FROM donations
+    ''')
+    total_donations, delivered_donations, total_beneficiaries, active_ngos = cursor.fetchone()
     
     conn.close()
     
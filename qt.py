@@ -17,13 +17,54 @@ import os
 import argparse
 import time
 import json
+import re
 import websockets
 from pathlib import Path
 
 # Port constants
 DEFAULT_PORT = 8000
+SERVER_URL = f"http://127.0.0.1:{DEFAULT_PORT}"
 WEBSOCKET_URL = f"ws://127.0.0.1:{DEFAULT_PORT}/ws"
-API_BASE = f"http://127.0.0.1:{DEFAULT_PORT}/api"
+API_BASE = f"{SERVER_URL}/api"
+
+# Log status indicators
+STATUS_SYMBOLS = {"PASS": "[+]", "FAIL": "[-]", "INFO": "[*]", "WARN": "[!]"}
+
+# Key UI elements expected on the frontend page and the markers that indicate them
+UI_ELEMENTS = (
+    ("Donation form", ("donation",)),
+    ("NGO registration", ("ngo",)),
+    ("File upload", ("upload",)),
+    ("Dashboard", ("dashboard",)),
+    ("Statistics", ("stats", "impact")),
+    ("JavaScript", ("<script",)),
+    ("CSS styling", ("style",)),
+    ("WebSocket code", ("websocket", "ws://")),
+)
+UI_MARKERS_RE = re.compile("|".join(
+    re.escape(marker) for _, element_markers in UI_ELEMENTS for marker in element_markers
+), re.IGNORECASE)
+
+# Core components (must work for basic functionality)
+CORE_COMPONENTS = (
+    ('http_server', '🌐 HTTP Server', 'Basic web server'),
+    ('api_donations', '🍽️  Donations API', 'Core donation management'),
+    ('api_ngos', '🏢 NGOs API', 'NGO registration and management'),
+    ('api_pickups', '🚚 Pickups API', 'Pickup coordination'),
+    ('frontend_interface', '🖥️  Web Interface', 'User interface'),
+    ('database_operations', '💾 Database Operations', 'Data persistence'),
+)
+
+# Enhanced components (improve user experience)
+ENHANCED_COMPONENTS = (
+    ('websocket_connection', '🔌 WebSocket Connection', 'Real-time connectivity'),
+    ('websocket_broadcasting', '📡 WebSocket Broadcasting', 'Live notifications'),
+    ('real_time_updates', '⚡ Real-time Updates', 'Instant UI updates'),
+    ('file_upload', '📤 File Upload', 'Photo attachments'),
+    ('photo_upload', '📸 Photo Upload', 'Donation photos'),
+    ('status_updates', '📊 Status Updates', 'Pickup status tracking'),
+    ('api_stats', '📈 Statistics API', 'Impact metrics'),
+)
 
 class FoodRescueQuickTest:
     """Quick comprehensive test for Food Rescue system"""
@@ -55,10 +96,23 @@ class FoodRescueQuickTest:
             'pickup_id': None
         }
         
+        # HTTP timeouts shared by every check (uploads and multi-step flows get longer)
+        self.timeout = aiohttp.ClientTimeout(total=10)
+        self.long_timeout = aiohttp.ClientTimeout(total=15)
+        
+        # Test groups in run order: (label, coroutine method, skipped)
+        self.suite = [
+            ("HTTP endpoints", self.test_http_endpoints, False),
+            ("API endpoints", self.test_api_endpoints, False),
+            ("Frontend interface", self.test_frontend_interface, False),
+            ("WebSocket tests", self.test_websocket_functionality, skip_websocket),
+            ("Donation flow tests", self.test_donation_flow, skip_donations),
+            ("File operations", self.test_file_operations, False),
+        ]
+        
     def log(self, message, status="INFO"):
         """Simple logging with status indicators"""
-        symbols = {"PASS": "[+]", "FAIL": "[-]", "INFO": "[*]", "WARN": "[!]"}
-        print(f"{symbols.get(status, '[*]')} {message}")
+        print(f"{STATUS_SYMBOLS.get(status, '[*]')} {message}")
 
     def check_server_running(self):
         """Check if server is running on the expected port"""
@@ -84,29 +138,11 @@ class FoodRescueQuickTest:
         self.log(f"Server detected on port {DEFAULT_PORT}", "PASS")
         
         try:
-            # Test HTTP endpoints
-            await self.test_http_endpoints()
-            
-            # Test API endpoints
-            await self.test_api_endpoints()
-            
-            # Test frontend interface
-            await self.test_frontend_interface()
-            
-            # Test WebSocket functionality
-            if not self.skip_websocket:
-                await self.test_websocket_functionality()
-            else:
-                self.log("WebSocket tests: Skipped", "INFO")
-            
-            # Test complete donation flow
-            if not self.skip_donations:
-                await self.test_donation_flow()
-            else:
-                self.log("Donation flow tests: Skipped", "INFO")
-            
-            # Test file uploads
-            await self.test_file_operations()
+            for label, test, skipped in self.suite:
+                if skipped:
+                    self.log(f"{label}: Skipped", "INFO")
+                    continue
+                await test()
             
             elapsed = time.time() - start_time
             self.log(f"Quick test completed in {elapsed:.1f}s!", "PASS")
@@ -120,12 +156,11 @@ class FoodRescueQuickTest:
         """Test basic HTTP endpoints and connectivity"""
         self.log("Testing HTTP connectivity...")
         
-        timeout = aiohttp.ClientTimeout(total=10)
-        async with aiohttp.ClientSession(timeout=timeout) as session:
+        async with aiohttp.ClientSession(timeout=self.timeout) as session:
             
             # Test root endpoint
             try:
-                async with session.get(f"http://127.0.0.1:{DEFAULT_PORT}/") as response:
+                async with session.get(f"{SERVER_URL}/") as response:
                     if response.status == 200:
                         content = await response.text()
                         if "Food Rescue" in content:
@@ -159,23 +194,16 @@ class FoodRescueQuickTest:
         """Test all API endpoints comprehensively"""
         self.log("Testing API endpoints...")
         
-        timeout = aiohttp.ClientTimeout(total=10)
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            
-            # Test donations API
-            await self._test_donations_api(session)
+        async with aiohttp.ClientSession(timeout=self.timeout) as session:
             
-            # Test NGOs API
-            await self._test_ngos_api(session)
-            
-            # Test pickups API
-            await self._test_pickups_api(session)
-            
-            # Test stats API
-            await self._test_stats_api(session)
-            
-            # Test WebSocket stats
-            await self._test_websocket_stats(session)
+            # The read-only API checks are independent, so run them concurrently
+            await asyncio.gather(
+                self._test_donations_api(session),
+                self._test_ngos_api(session),
+                self._test_pickups_api(session),
+                self._test_stats_api(session),
+                self._test_websocket_stats(session),
+            )
 
     async def _test_donations_api(self, session):
         """Test donations API endpoints"""
@@ -251,35 +279,25 @@ class FoodRescueQuickTest:
         """Test frontend interface elements"""
         self.log("Testing frontend interface...")
         
-        timeout = aiohttp.ClientTimeout(total=10)
-        async with aiohttp.ClientSession(timeout=timeout) as session:
+        async with aiohttp.ClientSession(timeout=self.timeout) as session:
             try:
-                async with session.get(f"http://127.0.0.1:{DEFAULT_PORT}/") as response:
+                async with session.get(f"{SERVER_URL}/") as response:
                     if response.status == 200:
                         content = await response.text()
                         
-                        # Check for key UI elements
-                        ui_elements = [
-                            ("Donation form", "donation" in content.lower()),
-                            ("NGO registration", "ngo" in content.lower()),
-                            ("File upload", "upload" in content.lower()),
-                            ("Dashboard", "dashboard" in content.lower()),
-                            ("Statistics", "stats" in content.lower() or "impact" in content.lower()),
-                            ("JavaScript", "<script" in content.lower()),
-                            ("CSS styling", "style" in content.lower()),
-                            ("WebSocket code", "websocket" in content.lower() or "ws://" in content.lower())
-                        ]
+                        # Check for key UI elements in a single scan of the page
+                        markers = {m.group(0).lower() for m in UI_MARKERS_RE.finditer(content)}
                         
                         found_elements = 0
-                        for element_name, found in ui_elements:
-                            if found:
+                        for element_name, element_markers in UI_ELEMENTS:
+                            if not markers.isdisjoint(element_markers):
                                 self.log(f"UI {element_name}: Found", "PASS")
                                 found_elements += 1
                             else:
                                 self.log(f"UI {element_name}: Missing", "WARN")
                         
                         # Mark frontend as working if most elements found
-                        if found_elements >= len(ui_elements) * 0.75:
+                        if found_elements >= len(UI_ELEMENTS) * 0.75:
                             self.components['frontend_interface'] = True
                             
                     else:
@@ -337,8 +355,7 @@ class FoodRescueQuickTest:
                 "expiry_hours": 24
             }
             
-            timeout = aiohttp.ClientTimeout(total=10)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
+            async with aiohttp.ClientSession(timeout=self.timeout) as session:
                 async with session.post(f"{API_BASE}/donations/", json=test_donation) as response:
                     if response.status == 200:
                         result = await response.json()
@@ -372,8 +389,7 @@ class FoodRescueQuickTest:
         """Test complete donation flow: create → accept → pickup → deliver"""
         self.log("Testing complete donation flow...")
         
-        timeout = aiohttp.ClientTimeout(total=15)
-        async with aiohttp.ClientSession(timeout=timeout) as session:
+        async with aiohttp.ClientSession(timeout=self.long_timeout) as session:
             
             # Step 1: Create NGO (if needed)
             await self._create_test_ngo(session)
@@ -471,7 +487,7 @@ class FoodRescueQuickTest:
         for status, description in status_updates:
             try:
                 # Note: Using the correct endpoint format
-                url = f"http://127.0.0.1:{DEFAULT_PORT}/pickups/{self.test_data['pickup_id']}"
+                url = f"{SERVER_URL}/pickups/{self.test_data['pickup_id']}"
                 params = {"status": status}
                 
                 async with session.patch(url, params=params) as response:
@@ -486,140 +502,137 @@ class FoodRescueQuickTest:
         """Test file upload functionality"""
         self.log("Testing file operations...")
         
+        # Nothing to upload against without a donation, so skip before opening a session
+        if not self.test_data['donation_id']:
+            self.log("File upload: Skipped (no donation ID)", "WARN")
+            return
+        
         try:
             # Create a test file
             test_content = f"QuickTest file content {time.time()}".encode()
             
-            timeout = aiohttp.ClientTimeout(total=15)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
+            async with aiohttp.ClientSession(timeout=self.long_timeout) as session:
                 
                 # Test file upload for donation
-                if self.test_data['donation_id']:
-                    data = aiohttp.FormData()
-                    data.add_field('file', test_content, filename='quicktest.txt', content_type='text/plain')
-                    
-                    upload_url = f"{API_BASE}/donations/{self.test_data['donation_id']}/upload-photo"
-                    
-                    async with session.post(upload_url, data=data) as response:
-                        if response.status == 200:
-                            result = await response.json()
-                            photo_url = result.get('photo_url')
-                            self.log(f"File upload: OK ({photo_url})", "PASS")
-                            self.components['file_upload'] = True
-                            self.components['photo_upload'] = True
-                        else:
-                            raise Exception(f"HTTP {response.status}")
-                else:
-                    self.log("File upload: Skipped (no donation ID)", "WARN")
+                data = aiohttp.FormData()
+                data.add_field('file', test_content, filename='quicktest.txt', content_type='text/plain')
+                
+                upload_url = f"{API_BASE}/donations/{self.test_data['donation_id']}/upload-photo"
+                
+                async with session.post(upload_url, data=data) as response:
+                    if response.status == 200:
+                        result = await response.json()
+                        photo_url = result.get('photo_url')
+                        self.log(f"File upload: OK ({photo_url})", "PASS")
+                        self.components['file_upload'] = True
+                        self.components['photo_upload'] = True
+                    else:
+                        raise Exception(f"HTTP {response.status}")
                     
         except Exception as e:
             self.log(f"File operations: {str(e)}", "FAIL")
 
     def print_component_status(self):
         """Print comprehensive component status report"""
-        print("\n" + "=" * 60)
-        print("🍽️  FOOD RESCUE SYSTEM - COMPONENT STATUS REPORT")
-        print("=" * 60)
+        # Collect the report and write it to stdout in one go
+        lines = []
+        out = lines.append
         
-        # Core components (must work for basic functionality)
-        core_components = [
-            ('http_server', '🌐 HTTP Server', 'Basic web server'),
-            ('api_donations', '🍽️  Donations API', 'Core donation management'),
-            ('api_ngos', '🏢 NGOs API', 'NGO registration and management'),
-            ('api_pickups', '🚚 Pickups API', 'Pickup coordination'),
-            ('frontend_interface', '🖥️  Web Interface', 'User interface'),
-            ('database_operations', '💾 Database Operations', 'Data persistence')
-        ]
+        out("\n" + "=" * 60)
+        out("🍽️  FOOD RESCUE SYSTEM - COMPONENT STATUS REPORT")
+        out("=" * 60)
         
-        # Enhanced components (improve user experience)
-        enhanced_components = [
-            ('websocket_connection', '🔌 WebSocket Connection', 'Real-time connectivity'),
-            ('websocket_broadcasting', '📡 WebSocket Broadcasting', 'Live notifications'),
-            ('real_time_updates', '⚡ Real-time Updates', 'Instant UI updates'),
-            ('file_upload', '📤 File Upload', 'Photo attachments'),
-            ('photo_upload', '📸 Photo Upload', 'Donation photos'),
-            ('status_updates', '📊 Status Updates', 'Pickup status tracking'),
-            ('api_stats', '📈 Statistics API', 'Impact metrics')
-        ]
+        # Walk each component table once, building its status lines and failures together
+        failed_components = []
+        core_lines = []
+        core_working = 0
+        for key, name, description in CORE_COMPONENTS:
+            if self.components.get(key, False):
+                core_lines.append(f"   {name}: ✅ WORKING")
+                core_working += 1
+            else:
+                core_lines.append(f"   {name}: ❌ FAILED")
+                core_lines.append(f"      ⚠️  Critical: {description} not functioning")
+                failed_components.append(name)
+        
+        enhanced_lines = []
+        enhanced_working = 0
+        for key, name, description in ENHANCED_COMPONENTS:
+            if key not in self.components:
+                status = "⚠️  NOT TESTED"
+                failed_components.append(name)
+            elif self.components[key]:
+                status = "✅ WORKING"
+                enhanced_working += 1
+            else:
+                status = f"❌ FAILED - {description}"
+                failed_components.append(name)
+            enhanced_lines.append(f"   {name}: {status}")
         
         # Count working components
         total_components = len(self.components)
         working_components = sum(1 for status in self.components.values() if status)
-        core_working = sum(1 for key, _, _ in core_components if self.components.get(key, False))
-        enhanced_working = sum(1 for key, _, _ in enhanced_components if self.components.get(key, False))
         
-        print(f"\n📈 OVERALL STATUS: {working_components}/{total_components} components working")
+        out(f"\n📈 OVERALL STATUS: {working_components}/{total_components} components working")
         
         # Calculate scores
-        core_score = (core_working / len(core_components)) * 100
-        enhanced_score = (enhanced_working / len(enhanced_components)) * 100
+        core_score = (core_working / len(CORE_COMPONENTS)) * 100
+        enhanced_score = (enhanced_working / len(ENHANCED_COMPONENTS)) * 100
         total_score = (working_components / total_components) * 100
         
-        print(f"🎯 FUNCTIONALITY SCORES:")
-        print(f"   • Core Features: {core_score:.0f}% ({core_working}/{len(core_components)})")
-        print(f"   • Enhanced Features: {enhanced_score:.0f}% ({enhanced_working}/{len(enhanced_components)})")
-        print(f"   • Overall System: {total_score:.0f}% ({working_components}/{total_components})")
+        out(f"🎯 FUNCTIONALITY SCORES:")
+        out(f"   • Core Features: {core_score:.0f}% ({core_working}/{len(CORE_COMPONENTS)})")
+        out(f"   • Enhanced Features: {enhanced_score:.0f}% ({enhanced_working}/{len(ENHANCED_COMPONENTS)})")
+        out(f"   • Overall System: {total_score:.0f}% ({working_components}/{total_components})")
         
         # Core components status
-        print(f"\n🚀 CORE COMPONENTS (Essential for food rescue):")
-        for key, name, description in core_components:
-            status = "✅ WORKING" if self.components.get(key, False) else "❌ FAILED"
-            print(f"   {name}: {status}")
-            if not self.components.get(key, False):
-                print(f"      ⚠️  Critical: {description} not functioning")
+        out(f"\n🚀 CORE COMPONENTS (Essential for food rescue):")
+        lines.extend(core_lines)
         
         # Enhanced components status
-        print(f"\n⭐ ENHANCED COMPONENTS (Better user experience):")
-        for key, name, description in enhanced_components:
-            if key in self.components:
-                status = "✅ WORKING" if self.components[key] else "❌ FAILED"
-                if not self.components[key]:
-                    status += f" - {description}"
-            else:
-                status = "⚠️  NOT TESTED"
-            print(f"   {name}: {status}")
+        out(f"\n⭐ ENHANCED COMPONENTS (Better user experience):")
+        lines.extend(enhanced_lines)
         
         # Hackathon readiness assessment
-        print(f"\n🏆 HACKATHON READINESS:")
-        if core_working == len(core_components):
-            if enhanced_working >= len(enhanced_components) * 0.8:
-                print(f"   • Status: 🥇 EXCELLENT - Ready for demo!")
-                print(f"   • Demo Quality: ⭐⭐⭐⭐⭐ Outstanding user experience")
-            elif enhanced_working >= len(enhanced_components) * 0.6:
-                print(f"   • Status: 🥈 VERY GOOD - Strong demo ready")
-                print(f"   • Demo Quality: ⭐⭐⭐⭐ Great user experience")
+        out(f"\n🏆 HACKATHON READINESS:")
+        if core_working == len(CORE_COMPONENTS):
+            if enhanced_working >= len(ENHANCED_COMPONENTS) * 0.8:
+                out(f"   • Status: 🥇 EXCELLENT - Ready for demo!")
+                out(f"   • Demo Quality: ⭐⭐⭐⭐⭐ Outstanding user experience")
+            elif enhanced_working >= len(ENHANCED_COMPONENTS) * 0.6:
+                out(f"   • Status: 🥈 VERY GOOD - Strong demo ready")
+                out(f"   • Demo Quality: ⭐⭐⭐⭐ Great user experience")
             else:
-                print(f"   • Status: 🥉 GOOD - Basic demo ready")
-                print(f"   • Demo Quality: ⭐⭐⭐ Solid functionality")
-        elif core_working >= len(core_components) * 0.8:
-            print(f"   • Status: ⚡ MOSTLY READY - Minor fixes needed")
-            print(f"   • Action: 🔧 Fix {len(core_components) - core_working} core issue(s)")
+                out(f"   • Status: 🥉 GOOD - Basic demo ready")
+                out(f"   • Demo Quality: ⭐⭐⭐ Solid functionality")
+        elif core_working >= len(CORE_COMPONENTS) * 0.8:
+            out(f"   • Status: ⚡ MOSTLY READY - Minor fixes needed")
+            out(f"   • Action: 🔧 Fix {len(CORE_COMPONENTS) - core_working} core issue(s)")
         else:
-            print(f"   • Status: ⚠️  NOT READY - Major issues")
-            print(f"   • Action: 🚨 Fix {len(core_components) - core_working} critical failure(s)")
+            out(f"   • Status: ⚠️  NOT READY - Major issues")
+            out(f"   • Action: 🚨 Fix {len(CORE_COMPONENTS) - core_working} critical failure(s)")
         
         # Performance metrics
-        print(f"\n⚡ PERFORMANCE METRICS:")
-        print(f"   • Test Speed: Fast (< 10 seconds)")
-        print(f"   • API Response: Quick")
-        print(f"   • WebSocket Latency: Low")
-        print(f"   • Ready for: Manual testing, Live demo, Production")
+        out(f"\n⚡ PERFORMANCE METRICS:")
+        out(f"   • Test Speed: Fast (< 10 seconds)")
+        out(f"   • API Response: Quick")
+        out(f"   • WebSocket Latency: Low")
+        out(f"   • Ready for: Manual testing, Live demo, Production")
         
         # Next steps
-        print(f"\n🎯 NEXT STEPS:")
-        failed_components = [name for key, name, _ in core_components + enhanced_components 
-                           if not self.components.get(key, False)]
-        
+        out(f"\n🎯 NEXT STEPS:")
         if not failed_components:
-            print(f"   • 🎉 All systems operational!")
-            print(f"   • 🚀 Ready for hackathon presentation")
-            print(f"   • 💡 Consider adding extra features if time permits")
+            out(f"   • 🎉 All systems operational!")
+            out(f"   • 🚀 Ready for hackathon presentation")
+            out(f"   • 💡 Consider adding extra features if time permits")
         else:
-            print(f"   • 🔧 Fix these components: {', '.join(failed_components[:3])}")
+            out(f"   • 🔧 Fix these components: {', '.join(failed_components[:3])}")
             if len(failed_components) > 3:
-                print(f"   • 📝 And {len(failed_components) - 3} more...")
+                out(f"   • 📝 And {len(failed_components) - 3} more...")
+        
+        out("=" * 60)
         
-        print("=" * 60)
+        sys.stdout.write("\n".join(lines) + "\n")
 
 async def main():
     """Main test runner"""